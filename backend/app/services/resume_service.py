@@ -2,17 +2,35 @@
 Resume Processing Service
 Handles PDF parsing, text extraction, resume structuring, and career insights generation
 """
+import asyncio
+import copy
+import hashlib
 import logging
+import os
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import json
 import base64
 
-# PDF processing
-import PyPDF2
-import pdfplumber
-from docx import Document
+# PDF/DOCX libraries (PyPDF2, pdfplumber, python-docx) are imported where they're
+# used - pdfplumber/pdfminer alone add hundreds of ms to every worker's startup
+
+# Optional PDFium-backed extraction (much faster than pdfplumber's layout pass)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pdfium = None
+    PDFIUM_AVAILABLE = False
+
+# XML parser for reading DOCX text directly (lxml when available, stdlib otherwise)
+try:
+    from lxml import etree
+except ImportError:
+    import xml.etree.ElementTree as etree
 
 # Text processing (optional - disabled due to compatibility issues)
 try:
@@ -24,17 +42,152 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     TfidfVectorizer = None
 
-# OpenAI for LLM processing
-import openai
-from openai import OpenAI
+# Faster parsing of OpenAI JSON responses when orjson is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# pdfminer (under pdfplumber) logs per token at DEBUG/INFO - keep it quiet even
+# when the app runs with verbose logging, or PDF extraction slows to a crawl
+logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("pdfplumber").setLevel(logging.WARNING)
+
+# Skills the similarity matcher looks for in job text
+JOB_SKILLS = (
+    'python', 'javascript', 'react', 'node.js', 'java', 'c++', 'sql',
+    'aws', 'docker', 'kubernetes', 'git', 'html', 'css', 'typescript', 
+    'mongodb', 'postgresql', 'redis', 'ai', 'go', 'pytorch'
+)
+
+def _compile_skills_pattern(skills) -> re.Pattern:
+    """
+    Single alternation over all skills, compiled once. Lookarounds rather than \b
+    so skills ending in symbols ('c++', 'node.js') still match as whole words
+    """
+    return re.compile(
+        r'(?<!\w)(?:' + '|'.join(re.escape(skill) for skill in sorted(skills, key=len, reverse=True)) + r')(?!\w)'
+    )
+
+JOB_SKILLS_PATTERN = _compile_skills_pattern(JOB_SKILLS)
+
+# Skills the rule-based resume parser looks for: the job vocabulary plus
+# frameworks/languages that only matter when reading a resume
+RESUME_SKILL_KEYWORDS = JOB_SKILLS + (
+    'machine learning', 'fastapi', 'django', 'flask', 'angular', 'vue.js',
+    'swift', 'kotlin', 'rust', 'scala', 'tensorflow'
+)
+RESUME_SKILLS_PATTERN = _compile_skills_pattern(RESUME_SKILL_KEYWORDS)
+# Display form of each keyword, in RESUME_SKILL_KEYWORDS order
+RESUME_SKILL_TITLES = {skill: skill.title() for skill in RESUME_SKILL_KEYWORDS}
+
+# Contact details pulled out by the rule-based parser
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Resume section headings; the LLM structuring prompt caps each section's length
+RESUME_SECTION_PATTERN = re.compile(
+    r'\n(?=[ \t]*(?:professional |work )?(?:summary|experience|education|skills|projects|certifications)\b)',
+    re.IGNORECASE
+)
+MAX_SECTION_CHARS = 4000
+
+def _compact_resume_text(text: str) -> str:
+    """Trim each resume section to MAX_SECTION_CHARS so one long section can't bloat the prompt"""
+    return "\n".join(section[:MAX_SECTION_CHARS] for section in RESUME_SECTION_PATTERN.split(text))
+
+# WordprocessingML tags read from word/document.xml
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+WORD_PARAGRAPH = WORD_NS + 'p'
+WORD_TEXT = WORD_NS + 't'
+WORD_TAB = WORD_NS + 'tab'
+WORD_BREAKS = (WORD_NS + 'br', WORD_NS + 'cr')
+# Word stores text boxes twice: mc:Choice (wps:txbx) and a legacy copy in mc:Fallback (v:textbox)
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# PDF extraction limits: resumes carry their content on the first pages, so stop at
+# MAX_PDF_PAGES, or earlier once there's plenty of text and the contact email was seen
+MAX_PDF_PAGES = int(os.getenv("RESUME_MAX_PDF_PAGES", "5"))
+PDF_ENOUGH_TEXT_CHARS = 8192
+
+def _pdf_text_complete(page_texts: List[str], text_chars: int) -> bool:
+    """True once extracted pages hold enough text, including an email address, to stop reading"""
+    return text_chars > PDF_ENOUGH_TEXT_CHARS and any(EMAIL_PATTERN.search(page_text) for page_text in page_texts)
+
+# Skill/role terms that boost the basic similarity score when both texts contain them
+SIMILARITY_TERMS = frozenset(JOB_SKILLS) | frozenset([
+    'engineer', 'developer', 'software', 'senior', 'junior', 'full-stack'
+])
+
+# Token separator that keeps skill punctuation intact ('node.js', 'full-stack', 'c++', 'c#')
+TOKEN_SPLIT_PATTERN = re.compile(r'[^\w+#.-]+')
+
+def _tokenize(text: str, already_lower: bool = False) -> frozenset:
+    """Lowercase token set of a text, with sentence punctuation trimmed"""
+    lowered = text if already_lower else text.lower()
+    return frozenset(
+        token for token in (raw.strip('.') for raw in TOKEN_SPLIT_PATTERN.split(lowered)) if token
+    )
+
+@lru_cache(maxsize=1024)
+def _word_sets(lowered_text: str) -> tuple:
+    """
+    (whitespace-split words, _tokenize tokens) of an already lowercased text as frozensets.
+    Memoized so the same job or resume text is split once across requests rather than on every match.
+    """
+    return frozenset(lowered_text.split()), _tokenize(lowered_text, already_lower=True)
+
+@lru_cache(maxsize=1024)
+def extract_job_skills(text: str, already_lower: bool = False) -> tuple:
+    """JOB_SKILLS found in a text, in JOB_SKILLS order; memoized since the same postings get rescanned"""
+    found = set(JOB_SKILLS_PATTERN.findall(text if already_lower else text.lower()))
+    return tuple(skill for skill in JOB_SKILLS if skill in found)
+
+def _async_openai_client(api_key: Optional[str]):
+    """AsyncOpenAI client for LLM processing; the SDK is imported on first use"""
+    if not api_key:
+        return None
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=api_key)
+
+# Bump when a prompt changes so its cached LLM results are recomputed
+STRUCTURE_PROMPT_VERSION = 1
+INSIGHTS_PROMPT_VERSION = 1
+
 class ResumeProcessor:
     """Resume processor with career intelligence"""
     
+    # Cached results (extracted text, LLM structuring, career insights) kept per process
+    MAX_CACHED_RESULTS = 256
+    
     def __init__(self, openai_api_key: Optional[str] = None):
-        self.openai_client = OpenAI(api_key=openai_api_key) if openai_api_key else None
+        # Async client so structuring/insights calls don't block the event loop
+        self.openai_client = _async_openai_client(openai_api_key)
+        # Content-addressed LRU cache: {(kind, sha256, version): result}
+        self.result_cache = OrderedDict()
+    
+    def _cache_get(self, key: tuple, required_key: Optional[str] = None) -> Any:
+        """Return a copy of a cached result, dropping entries that no longer look valid"""
+        value = self.result_cache.get(key)
+        if value is None:
+            return None
+        if required_key and (not isinstance(value, dict) or required_key not in value):
+            del self.result_cache[key]
+            return None
+        self.result_cache.move_to_end(key)
+        # Callers mutate the dicts they get back, so never hand out the cached object
+        return copy.deepcopy(value)
+    
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        """Store a result, evicting the least recently used past MAX_CACHED_RESULTS"""
+        self.result_cache[key] = copy.deepcopy(value)
+        self.result_cache.move_to_end(key)
+        while len(self.result_cache) > self.MAX_CACHED_RESULTS:
+            self.result_cache.popitem(last=False)
         
     async def process_resume_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
@@ -48,14 +201,31 @@ class ResumeProcessor:
             Resume data with career insights
         """
         try:
-            # Extract text based on file type
-            text = await self._extract_text_from_file(file_content, filename)
-            
-            # Process and structure the resume data
-            structured_data = await self._structure_resume_data(text)
+            # Extract text based on file type - the same upload (retries, demos)
+            # hashes to the same key, so skip re-parsing it
+            text_key = ("text", hashlib.sha256(file_content).hexdigest(), Path(filename).suffix.lower())
+            text = self._cache_get(text_key)
+            if text is None:
+                text = await self._extract_text_from_file(file_content, filename)
+                self._cache_put(text_key, text)
             
-            # Generate career insights using LLM
-            career_insights = await self._generate_career_insights(structured_data, text)
+            if self.openai_client:
+                # Insights only need the resume's content, not the LLM's structured copy of it,
+                # so start them from the fast rule-based parse and run both OpenAI calls at once
+                structured_data, career_insights = await asyncio.gather(
+                    self._structure_resume_data(text),
+                    self._generate_career_insights(self._structure_with_rules(text), text)
+                )
+                # If the insights call failed, its rule-based fallback saw the rules parse (no
+                # experience); rebuild it from the final structured data instead
+                if "analysis_version" not in career_insights:
+                    career_insights = self._generate_basic_insights(structured_data)
+            else:
+                # Process and structure the resume data
+                structured_data = await self._structure_resume_data(text)
+                
+                # Generate career insights (rule-based without an LLM)
+                career_insights = await self._generate_career_insights(structured_data, text)
             
             # Combine structured data with career insights
             enhanced_data = {
@@ -94,36 +264,112 @@ class ResumeProcessor:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
     def _extract_from_pdf(self, pdf_bytes: bytes) -> str:
-        """Extract text from PDF using multiple methods"""
+        """Extract text from PDF using multiple methods, reading at most MAX_PDF_PAGES pages"""
         text = ""
         
+        # Method 1: pypdfium2 (fast C++ text extraction)
+        if PDFIUM_AVAILABLE:
+            try:
+                pdf = pdfium.PdfDocument(pdf_bytes)
+                try:
+                    page_texts = []
+                    text_chars = 0
+                    for page_index in range(min(len(pdf), MAX_PDF_PAGES)):
+                        page = pdf[page_index]
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                        
+                        page_texts.append(page_text)
+                        text_chars += len(page_text)
+                        if _pdf_text_complete(page_texts, text_chars):
+                            break
+                finally:
+                    pdf.close()
+                
+                text = "\n".join(page_texts).strip()
+                if text:
+                    return text
+            except Exception as e:
+                logger.warning(f"pypdfium2 failed: {e}")
+        
+        page_texts = []
+        text_chars = 0
         try:
-            # Method 1: pdfplumber (better for complex layouts)
+            # Method 2: pdfplumber (better for complex layouts)
             import io
+            import pdfplumber
             with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                for page in pdf.pages:
+                for page in pdf.pages[:MAX_PDF_PAGES]:
                     page_text = page.extract_text()
+                    # Drop the page's cached chars/objects once its text is out
+                    page.flush_cache()
                     if page_text:
-                        text += page_text + "\n"
+                        page_texts.append(page_text)
+                        text_chars += len(page_text)
+                        if _pdf_text_complete(page_texts, text_chars):
+                            break
         except Exception as e:
             logger.warning(f"pdfplumber failed: {e}")
             
-            # Method 2: PyPDF2 (fallback)
+            # Method 3: PyPDF2 (fallback)
             try:
                 import io
+                import PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                for page in pdf_reader.pages[:MAX_PDF_PAGES]:
+                    page_text = page.extract_text()
+                    page_texts.append(page_text)
+                    text_chars += len(page_text)
+                    if _pdf_text_complete(page_texts, text_chars):
+                        break
             except Exception as e2:
                 logger.error(f"PyPDF2 also failed: {e2}")
                 raise ValueError("Could not extract text from PDF")
         
-        return text.strip()
+        return "\n".join(page_texts).strip()
     
     def _extract_from_docx(self, docx_bytes: bytes) -> str:
         """Extract text from DOCX file"""
+        import io
+        import zipfile
+        
         try:
-            import io
+            # Method 1: stream paragraph text straight out of word/document.xml,
+            # without building python-docx's full document object model
+            paragraphs = []
+            runs = []
+            fallback_depth = 0  # inside mc:Fallback - skip the duplicate text box copy
+            with zipfile.ZipFile(io.BytesIO(docx_bytes)) as docx_zip, docx_zip.open('word/document.xml') as document_xml:
+                for event, element in etree.iterparse(document_xml, events=('start', 'end')):
+                    if element.tag == MC_FALLBACK:
+                        if event == 'start':
+                            fallback_depth += 1
+                        else:
+                            fallback_depth -= 1
+                            element.clear()
+                        continue
+                    if event == 'start' or fallback_depth:
+                        continue
+                    
+                    if element.tag == WORD_TEXT:
+                        runs.append(element.text or '')
+                    elif element.tag == WORD_TAB:
+                        runs.append('\t')
+                    elif element.tag in WORD_BREAKS:
+                        runs.append('\n')
+                    elif element.tag == WORD_PARAGRAPH:
+                        paragraphs.append(''.join(runs))
+                        runs = []
+                        element.clear()  # Paragraph is done - free its subtree
+            return "\n".join(paragraphs)
+        except Exception as e:
+            logger.warning(f"Direct DOCX XML extraction failed: {e}")
+        
+        try:
+            # Method 2: python-docx (fallback)
+            from docx import Document
             doc = Document(io.BytesIO(docx_bytes))
             text = []
             
@@ -145,12 +391,18 @@ class ResumeProcessor:
     
     async def _structure_with_llm(self, text: str) -> Dict[str, Any]:
         """Use OpenAI to structure resume data"""
+        cache_key = ("structured", hashlib.sha256(text.encode()).hexdigest(), STRUCTURE_PROMPT_VERSION)
+        cached = self._cache_get(cache_key, required_key="skills")
+        if cached is not None:
+            logger.info("Using cached LLM resume structure")
+            return cached
+        
         try:
             prompt = f"""
             Parse this resume text and extract structured information in JSON format:
 
             RESUME TEXT:
-            {text}
+            {_compact_resume_text(text)}
 
             Extract the following information and return as valid JSON:
             {{
@@ -192,38 +444,26 @@ class ResumeProcessor:
             Return only valid JSON, no explanations.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a resume parsing expert. Extract structured data from resumes and return only valid JSON."},
                     {"role": "user", "content": prompt}
                 ],
+                # JSON mode - the reply is a bare JSON object, no markdown fences to strip
+                response_format={"type": "json_object"},
                 temperature=0.1,
                 max_tokens=2000
             )
             
             json_str = response.choices[0].message.content
-            logger.info(f" OPENAI RAW RESPONSE: '{json_str}'")
-            logger.info(f" RESPONSE TYPE: {type(json_str)}")
-            logger.info(f" RESPONSE LENGTH: {len(json_str) if json_str else 0}")
-            
             if not json_str or json_str.strip() == "":
                 logger.error("OpenAI returned empty response")
                 raise ValueError("Empty response from OpenAI")
             
-            # Strip markdown code block wrapper if present
-            json_str = json_str.strip()
-            if json_str.startswith("```json"):
-                json_str = json_str[7:]  # Remove ```json
-            if json_str.startswith("```"):
-                json_str = json_str[3:]   # Remove ```
-            if json_str.endswith("```"):
-                json_str = json_str[:-3]  # Remove trailing ```
-            json_str = json_str.strip()
-            
-            logger.info(f" CLEANED JSON: '{json_str[:200]}...'")
-            
-            return json.loads(json_str)
+            structured_data = json_loads(json_str)
+            self._cache_put(cache_key, structured_data)
+            return structured_data
             
         except Exception as e:
             logger.error(f"LLM structuring failed: {e}")
@@ -241,6 +481,13 @@ class ResumeProcessor:
             # Prepare resume summary for analysis
             resume_summary = self._prepare_resume_summary(structured_data, raw_text)
             
+            # The summary is exactly what the model sees, so it is the cache key
+            cache_key = ("insights", hashlib.sha256(resume_summary.encode()).hexdigest(), INSIGHTS_PROMPT_VERSION)
+            cached = self._cache_get(cache_key, required_key="career_level")
+            if cached is not None:
+                logger.info("Using cached career insights")
+                return cached
+            
             prompt = f"""
             Analyze this resume and provide intelligent career insights and recommendations.
             
@@ -312,43 +559,30 @@ class ResumeProcessor:
             Return only valid JSON.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
-                    {"role": "system", "content": "You are a career counselor and industry expert. Analyze resumes and provide detailed, actionable career insights based on current market trends."},
+                    {"role": "system", "content": "You are a career counselor and industry expert. Analyze resumes and provide detailed, actionable career insights based on current market trends. Respond in JSON."},
                     {"role": "user", "content": prompt}
                 ],
+                # JSON mode - the reply is a bare JSON object, no markdown fences to strip
+                response_format={"type": "json_object"},
                 temperature=0.3,
                 max_tokens=1500
             )
             
             raw_content = response.choices[0].message.content
-            logger.info(f" CAREER INSIGHTS RAW RESPONSE: '{raw_content}'")
-            logger.info(f" CAREER RESPONSE TYPE: {type(raw_content)}")
-            logger.info(f" CAREER RESPONSE LENGTH: {len(raw_content) if raw_content else 0}")
-            
             if not raw_content or raw_content.strip() == "":
                 logger.error("OpenAI returned empty career insights response")
                 raise ValueError("Empty career insights response from OpenAI")
             
-            # Strip markdown code block wrapper if present
-            raw_content = raw_content.strip()
-            if raw_content.startswith("```json"):
-                raw_content = raw_content[7:]  # Remove ```json
-            if raw_content.startswith("```"):
-                raw_content = raw_content[3:]   # Remove ```
-            if raw_content.endswith("```"):
-                raw_content = raw_content[:-3]  # Remove trailing ```
-            raw_content = raw_content.strip()
-            
-            logger.info(f" CLEANED CAREER JSON: '{raw_content[:200]}...'")
-            
-            insights = json.loads(raw_content)
+            insights = json_loads(raw_content)
             
             # Add metadata
             insights["generated_at"] = json.dumps({"timestamp": "now"}),
             insights["analysis_version"] = "1.0"
             
+            self._cache_put(cache_key, insights)
             return insights
             
         except Exception as e:
@@ -384,6 +618,10 @@ class ResumeProcessor:
             for edu in structured_data["education"][:2]:  # Top 2 education entries
                 summary_parts.append(f"- {edu.get('degree', 'N/A')} in {edu.get('field', 'N/A')}")
         
+        # A rule-based parse has no experience section - let the model read the resume itself
+        if not structured_data.get("experience") and raw_text:
+            summary_parts.append(f"Resume Text:\n{raw_text[:3000]}")
+        
         return "\n".join(summary_parts)
     
     def _generate_basic_insights(self, structured_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -438,29 +676,18 @@ class ResumeProcessor:
         }
         
         # Extract email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        email_match = EMAIL_PATTERN.search(text)
         if email_match:
             structured["personal_info"]["email"] = email_match.group()
         
         # Extract phone number
-        phone_match = re.search(r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+        phone_match = PHONE_PATTERN.search(text)
         if phone_match:
             structured["personal_info"]["phone"] = phone_match.group()
         
-        # Extract skills (look for common skill keywords)
-        skill_keywords = [
-            'python', 'javascript', 'react', 'node.js', 'java', 'c++', 'sql',
-            'aws', 'docker', 'kubernetes', 'git', 'html', 'css', 'typescript',
-            'mongodb', 'postgresql', 'redis', 'machine learning', 'ai',
-            'fastapi', 'django', 'flask', 'angular', 'vue.js', 'swift',
-            'kotlin', 'go', 'rust', 'scala', 'tensorflow', 'pytorch'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill.title())
+        # Extract skills (look for common skill keywords) in one pass over the text
+        found = set(RESUME_SKILLS_PATTERN.findall(text.lower()))
+        found_skills = [title for skill, title in RESUME_SKILL_TITLES.items() if skill in found]
         
         structured["skills"] = found_skills
         
@@ -494,14 +721,20 @@ class ResumeProcessor:
                 if 'technologies' in project:
                     skills.extend(project['technologies'])
         
-        # Remove duplicates and return
-        return list(set(skills))
+        # Remove duplicates case-insensitively, keeping first-seen order
+        return list(dict.fromkeys(skill.strip().lower() for skill in skills if isinstance(skill, str) and skill.strip()))
 
 class JobMatcher:
     """Enhanced job matcher with career insights integration"""
     
+    # Maximum OpenAI scoring requests in flight per match request
+    MAX_CONCURRENT_LLM_CALLS = 5
+    # Jobs scored per OpenAI call
+    LLM_BATCH_SIZE = 10
+    
     def __init__(self, openai_api_key: Optional[str] = None):
-        self.openai_client = OpenAI(api_key=openai_api_key) if openai_api_key else None
+        # Async client so per-job scoring calls can overlap instead of blocking the event loop
+        self.openai_client = _async_openai_client(openai_api_key)
         if SKLEARN_AVAILABLE:
             self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
         else:
@@ -525,18 +758,80 @@ class JobMatcher:
         # Get career insights if available
         career_insights = resume_data.get('career_insights', {})
         recommended_profiles = career_insights.get('recommended_job_profiles', [])
+        # Tokenize each profile title once rather than once per job
+        profile_tokens = [
+            (_tokenize(profile.get('title') or ''), profile.get('match_percentage', 0))
+            for profile in recommended_profiles
+        ]
         
         logger.info(f"Starting job matching for {len(jobs)} jobs")
         
+        # Resume text/skills are the same for every job - prepare them once
+        resume_context = self._build_resume_context(resume_data)
+        
+        # Score each distinct posting once - the same job listed on several boards
+        # reuses the first copy's result instead of costing another LLM call
+        unique_jobs = []
+        unique_index = {}  # {posting key: index into unique_jobs}
+        job_groups = []
+        for job in jobs:
+            if not job.get('title'):
+                key = id(job)  # Nothing to identify the posting by - never merge it
+            else:
+                key = hashlib.blake2b(
+                    f"{job['title']}|{job.get('company') or ''}|{job.get('location') or ''}".lower().encode(),
+                    digest_size=8
+                ).digest()
+            if key not in unique_index:
+                unique_index[key] = len(unique_jobs)
+                unique_jobs.append(job)
+            job_groups.append(unique_index[key])
+        if len(unique_jobs) < len(jobs):
+            logger.info(f"Scoring {len(unique_jobs)} unique postings for {len(jobs)} jobs")
+        
         # If OpenAI quota is exhausted, skip LLM calls for all jobs
         if self.openai_quota_exhausted:
             logger.info("OpenAI quota exhausted, using similarity matching for all jobs")
         
-        for i, job in enumerate(jobs):
-            match_result = await self._score_job_match(job, resume_data, career_insights)
+        if self.openai_quota_exhausted or not self.openai_client:
+            # Similarity scoring is CPU-only - run the whole batch in one worker
+            # thread rather than awaiting it job by job on the event loop
+            def score_all_jobs() -> List[Dict[str, Any]]:
+                similarities = self._batch_tfidf_similarities(unique_jobs, resume_context) or [None] * len(unique_jobs)
+                return [
+                    self._score_with_similarity(job, resume_data, resume_context, similarity)
+                    for job, similarity in zip(unique_jobs, similarities)
+                ]
+            
+            unique_results = await asyncio.to_thread(score_all_jobs)
+        else:
+            # Score jobs LLM_BATCH_SIZE at a time so the resume prompt is sent once per batch;
+            # batches run concurrently, capped so a large scan doesn't trip OpenAI rate limits
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LLM_CALLS)
+            resume_summary = self._build_llm_resume_summary(resume_data, career_insights)
+            
+            async def score_job(job: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._score_job_match(job, resume_data, career_insights, resume_context)
             
+            async def score_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    results = await self._score_jobs_batched(batch, resume_data, career_insights, resume_summary)
+                if results is None:
+                    # Fall back to one call per job (or similarity once the quota is gone)
+                    results = await asyncio.gather(*(score_job(job) for job in batch))
+                return results
+            
+            batches = [unique_jobs[i:i + self.LLM_BATCH_SIZE] for i in range(0, len(unique_jobs), self.LLM_BATCH_SIZE)]
+            batch_results = await asyncio.gather(*(score_batch(batch) for batch in batches))
+            unique_results = [result for results in batch_results for result in results]
+        
+        # Fan results back out; copy so the per-job profile boost below doesn't leak between duplicates
+        match_results = [dict(unique_results[group]) for group in job_groups]
+        
+        for i, (job, match_result) in enumerate(zip(jobs, match_results)):
             # Check if job matches recommended profiles
-            profile_boost = self._calculate_profile_boost(job, recommended_profiles)
+            profile_boost = self._calculate_profile_boost(job, profile_tokens)
             match_result['match_score'] = min(100, match_result.get('match_score', 60) + profile_boost)
             
             matched_jobs.append({
@@ -554,27 +849,26 @@ class JobMatcher:
         logger.info(f"Completed matching: {len(matched_jobs)} jobs processed")
         return matched_jobs
     
-    def _calculate_profile_boost(self, job: Dict[str, Any], recommended_profiles: List[Dict[str, Any]]) -> int:
-        """Calculate score boost based on recommended career profiles"""
-        job_title = job.get('title', '').lower()
+    def _calculate_profile_boost(self, job: Dict[str, Any], profile_tokens: List[tuple]) -> int:
+        """Calculate score boost based on recommended career profiles (pre-tokenized titles)"""
+        job_tokens = _tokenize(job.get('title') or '')
         
-        for profile in recommended_profiles:
-            profile_title = profile.get('title', '').lower()
-            if any(word in job_title for word in profile_title.split()):
-                return int(profile.get('match_percentage', 0) * 0.15)  # 15% boost
+        for title_tokens, match_percentage in profile_tokens:
+            if title_tokens & job_tokens:
+                return int(match_percentage * 0.15)  # 15% boost
         
         return 0
     
-    async def _score_job_match(self, job: Dict[str, Any], resume_data: Dict[str, Any], career_insights: Dict[str, Any]) -> Dict[str, Any]:
+    async def _score_job_match(self, job: Dict[str, Any], resume_data: Dict[str, Any], career_insights: Dict[str, Any], resume_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Enhanced job scoring with career insights"""
         
         # Skip OpenAI if quota exhausted or no client
         if self.openai_quota_exhausted or not self.openai_client:
-            return self._score_with_similarity(job, resume_data)
+            return self._score_with_similarity(job, resume_data, resume_context)
         
-        return await self._score_with_enhanced_llm(job, resume_data, career_insights)
+        return await self._score_with_enhanced_llm(job, resume_data, career_insights, resume_context)
     
-    async def _score_with_enhanced_llm(self, job: Dict[str, Any], resume_data: Dict[str, Any], career_insights: Dict[str, Any]) -> Dict[str, Any]:
+    async def _score_with_enhanced_llm(self, job: Dict[str, Any], resume_data: Dict[str, Any], career_insights: Dict[str, Any], resume_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Use OpenAI with career insights for enhanced scoring"""
         try:
             # Prepare enhanced context
@@ -585,57 +879,7 @@ class JobMatcher:
             Description: {job.get('description', 'N/A')[:500]}
             """
             
-            # Include career insights in analysis
-            insights_summary = ""
-            if career_insights:
-                recommended_profiles = career_insights.get('recommended_job_profiles', [])
-                strong_skills = career_insights.get('skill_analysis', {}).get('strong_skills', [])
-                career_level = career_insights.get('career_level', {}).get('current_level', 'Unknown')
-                
-                insights_summary = f"""
-                Career Level: {career_level}
-                Strong Skills: {', '.join(strong_skills)}
-                Recommended Profiles: {', '.join([p.get('title', '') for p in recommended_profiles[:3]])}
-                """
-            
-            resume_summary = f"""
-            Skills: {', '.join(resume_data.get('skills', []))}
-            
-            Experience ({len(resume_data.get('experience', []))} positions):"""
-            
-            # Add detailed experience information
-            for exp in resume_data.get('experience', [])[:3]:  # Top 3 experiences
-                title = exp.get('title') or 'N/A'
-                company = exp.get('company') or 'N/A'
-                duration = exp.get('duration') or 'N/A'
-                description = exp.get('description') or 'N/A'
-                technologies = exp.get('technologies') or []
-                
-                resume_summary += f"""
-            - {title} at {company} ({duration})
-              Description: {description[:200]}...
-              Technologies: {', '.join(technologies)}"""
-            
-            # Add project information
-            if resume_data.get('projects'):
-                resume_summary += f"""
-            
-            Key Projects ({len(resume_data.get('projects', []))}):")"""
-                for proj in resume_data.get('projects', [])[:3]:  # Top 3 projects
-                    proj_name = proj.get('name') or 'N/A'
-                    proj_desc = proj.get('description') or 'N/A'
-                    proj_tech = proj.get('technologies') or []
-                    
-                    resume_summary += f"""
-            - {proj_name}: {proj_desc[:150]}...
-              Technologies: {', '.join(proj_tech)}"""
-            
-            # Add career insights - ensure insights_summary is a string
-            insights_summary = insights_summary or ""
-            resume_summary += f"""
-            
-            Career Analysis:
-            {insights_summary}"""
+            resume_summary = self._build_llm_resume_summary(resume_data, career_insights)
             
             prompt = f"""
             Rate how well this resume matches this job posting, considering career insights.
@@ -660,7 +904,7 @@ class JobMatcher:
             Return only valid JSON.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are an expert job-resume matcher with deep understanding of career progression and skill requirements."},
@@ -670,7 +914,7 @@ class JobMatcher:
                 max_tokens=600
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = json_loads(response.choices[0].message.content)
             return result
             
         except Exception as e:
@@ -684,14 +928,142 @@ class JobMatcher:
             else:
                 logger.error(f"Enhanced LLM matching failed: {e}")
             
-            return self._score_with_similarity(job, resume_data)
+            return self._score_with_similarity(job, resume_data, resume_context)
     
-    def _score_with_similarity(self, job: Dict[str, Any], resume_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Fallback similarity-based matching with improved scoring"""
+    def _build_llm_resume_summary(self, resume_data: Dict[str, Any], career_insights: Dict[str, Any]) -> str:
+        """Resume and career insights section shared by the LLM scoring prompts"""
+        # Collect lines and join once instead of growing one string per entry
+        parts = [
+            f"Skills: {', '.join(resume_data.get('skills', []))}",
+            "",
+            f"Experience ({len(resume_data.get('experience', []))} positions):"
+        ]
         
-        # Extract text from job
-        job_text = f"{job.get('title') or ''} {job.get('description') or ''} {job.get('company') or ''}"
+        # Add detailed experience information
+        for exp in resume_data.get('experience', [])[:3]:  # Top 3 experiences
+            title = exp.get('title') or 'N/A'
+            company = exp.get('company') or 'N/A'
+            duration = exp.get('duration') or 'N/A'
+            description = exp.get('description') or 'N/A'
+            technologies = exp.get('technologies') or []
+            
+            parts.append(f"- {title} at {company} ({duration})")
+            parts.append(f"  Description: {description[:200]}...")
+            parts.append(f"  Technologies: {', '.join(technologies)}")
+        
+        # Add project information
+        if resume_data.get('projects'):
+            parts.append("")
+            parts.append(f"Key Projects ({len(resume_data.get('projects', []))}):")
+            for proj in resume_data.get('projects', [])[:3]:  # Top 3 projects
+                proj_name = proj.get('name') or 'N/A'
+                proj_desc = proj.get('description') or 'N/A'
+                proj_tech = proj.get('technologies') or []
+                
+                parts.append(f"- {proj_name}: {proj_desc[:150]}...")
+                parts.append(f"  Technologies: {', '.join(proj_tech)}")
         
+        # Include career insights in analysis
+        parts.append("")
+        parts.append("Career Analysis:")
+        if career_insights:
+            recommended_profiles = career_insights.get('recommended_job_profiles', [])
+            strong_skills = career_insights.get('skill_analysis', {}).get('strong_skills', [])
+            career_level = career_insights.get('career_level', {}).get('current_level', 'Unknown')
+            
+            parts.append(f"Career Level: {career_level}")
+            parts.append(f"Strong Skills: {', '.join(strong_skills)}")
+            parts.append(f"Recommended Profiles: {', '.join([p.get('title', '') for p in recommended_profiles[:3]])}")
+        
+        resume_summary = "\n".join(parts)
+        return resume_summary
+    
+    async def _score_jobs_batched(
+        self,
+        jobs: List[Dict[str, Any]],
+        resume_data: Dict[str, Any],
+        career_insights: Dict[str, Any],
+        resume_summary: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Score several jobs in one OpenAI call so the resume context is sent once.
+        Returns results in job order, or None if the batch couldn't be scored.
+        """
+        try:
+            jobs_block = json.dumps([
+                {
+                    "id": i,
+                    "title": job.get('title', 'N/A'),
+                    "company": job.get('company', 'N/A'),
+                    "location": job.get('location', 'N/A'),
+                    "description": (job.get('description') or 'N/A')[:500]
+                }
+                for i, job in enumerate(jobs)
+            ])
+            
+            prompt = f"""
+            Rate how well this resume matches each of these job postings, considering career insights.
+            
+            JOB POSTINGS (JSON array, one entry per job):
+            {jobs_block}
+            
+            RESUME & CAREER ANALYSIS:
+            {resume_summary}
+            
+            Provide enhanced analysis for every job in this JSON format, using each job's id:
+            {{
+                "matches": [
+                    {{
+                        "id": 0,
+                        "match_score": 85,
+                        "matching_skills": ["skill1", "skill2", "skill3"],
+                        "missing_skills": ["skill4", "skill5"],
+                        "summary": "Detailed explanation including career fit",
+                        "confidence": "high/medium/low",
+                        "career_progression": "excellent/good/fair/poor",
+                        "skill_gap_analysis": "Assessment of missing skills impact"
+                    }}
+                ]
+            }}
+            
+            Return only valid JSON.
+            """
+            
+            response = await self.openai_client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are an expert job-resume matcher with deep understanding of career progression and skill requirements. Respond with a JSON object."},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.2,
+                max_tokens=min(4000, 300 * len(jobs))
+            )
+            
+            matches = json_loads(response.choices[0].message.content).get('matches', [])
+            # Key by str(id) - the model sometimes echoes ids back as strings
+            results = {str(match.pop('id', None)): match for match in matches if isinstance(match, dict)}
+            if any(str(i) not in results for i in range(len(jobs))):
+                logger.warning(f"Batched LLM scoring returned {len(results)}/{len(jobs)} results, scoring batch per job")
+                return None
+            
+            return [results[str(i)] for i in range(len(jobs))]
+            
+        except Exception as e:
+            error_str = str(e)
+            
+            # Check for quota/rate limit errors and mark as exhausted
+            if any(keyword in error_str.lower() for keyword in ['quota', 'rate limit', '429', 'insufficient_quota']):
+                logger.error(f"OpenAI quota/rate limit hit: {e}")
+                self.openai_quota_exhausted = True
+                self.last_openai_error = error_str
+            else:
+                logger.error(f"Batched LLM matching failed: {e}")
+            
+            return None
+    
+    def _build_resume_context(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute the resume text, tokens and skills used by similarity scoring"""
         # Extract text from resume - ensure all values are strings
         resume_text = f"{resume_data.get('summary') or ''} {' '.join(resume_data.get('skills', []))}"
         for exp in resume_data.get('experience', []):
@@ -699,15 +1071,64 @@ class JobMatcher:
             description = exp.get('description') or ''
             resume_text += f" {title} {description}"
         
-        # Debug logging
-        logger.info(f"Job matching debug - Job: {job.get('title', 'Unknown')}")
-        logger.info(f"Job text length: {len(job_text)}")
-        logger.info(f"Resume text length: {len(resume_text)}")
-        logger.info(f"Resume skills: {resume_data.get('skills', [])}")
+        resume_words, resume_tokens = _word_sets(resume_text.lower())
+        return {
+            "text": resume_text,
+            "words": resume_words,
+            "tokens": resume_tokens,
+            # Built once per match request and reused for every job's skill split
+            "skill_set": frozenset(s.lower() for s in resume_data.get('skills', []))
+        }
+    
+    @staticmethod
+    def _job_text(job: Dict[str, Any]) -> str:
+        """Text of a job used for similarity scoring"""
+        return f"{job.get('title') or ''} {job.get('description') or ''} {job.get('company') or ''}"
+    
+    def _batch_tfidf_similarities(self, jobs: List[Dict[str, Any]], resume_context: Dict[str, Any]) -> Optional[List[float]]:
+        """
+        TF-IDF cosine similarity of every job against the resume from a single fit,
+        instead of refitting the vectorizer per job. None when sklearn is unavailable.
+        """
+        if not (SKLEARN_AVAILABLE and self.vectorizer) or len(resume_context["text"].strip()) <= 5:
+            return None
+        
+        try:
+            corpus = [resume_context["text"], *(self._job_text(job) for job in jobs)]
+            tfidf_matrix = self.vectorizer.fit_transform(corpus)
+            # Rows are L2-normalized, so one sparse product gives every cosine
+            return (tfidf_matrix[1:] @ tfidf_matrix[0].T).toarray().ravel().tolist()
+        except Exception as e:
+            logger.warning(f"Batched TF-IDF similarity calculation failed: {e}")
+            return None
+    
+    def _score_with_similarity(self, job: Dict[str, Any], resume_data: Dict[str, Any], resume_context: Optional[Dict[str, Any]] = None, tfidf_similarity: Optional[float] = None) -> Dict[str, Any]:
+        """Fallback similarity-based matching with improved scoring"""
+        
+        # Extract text from job
+        job_text = self._job_text(job)
+        
+        if resume_context is None:
+            resume_context = self._build_resume_context(resume_data)
+        resume_text = resume_context["text"]
+        
+        # Debug logging - runs once per job, so only format it when DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Job matching debug - Job: %s", job.get('title', 'Unknown'))
+            logger.debug("Job text length: %d", len(job_text))
+            logger.debug("Resume text length: %d", len(resume_text))
+            logger.debug("Resume skills: %s", resume_data.get('skills', []))
+        
+        # Lowercase once for both the word-set similarity and the skill scan
+        job_text_lower = job_text.lower()
         
         # Calculate similarity
         score = 65  # Improved default score (was 50)
-        if SKLEARN_AVAILABLE and self.vectorizer and len(job_text.strip()) > 5 and len(resume_text.strip()) > 5:
+        if tfidf_similarity is not None and len(job_text.strip()) > 5:
+            # Precomputed for the whole batch by _batch_tfidf_similarities
+            score = int(tfidf_similarity * 100)
+        elif SKLEARN_AVAILABLE and self.vectorizer and len(job_text.strip()) > 5 and len(resume_text.strip()) > 5:
             try:
                 corpus = [job_text, resume_text]
                 tfidf_matrix = self.vectorizer.fit_transform(corpus)
@@ -715,65 +1136,68 @@ class JobMatcher:
                 score = int(similarity * 100)
             except Exception as e:
                 logger.warning(f"TF-IDF similarity calculation failed: {e}")
-                score = self._calculate_basic_similarity(job_text, resume_text)
+                score = self._calculate_basic_similarity(job_text_lower, resume_context, already_lower=True)
         else:
-            score = self._calculate_basic_similarity(job_text, resume_text)
+            score = self._calculate_basic_similarity(job_text_lower, resume_context, already_lower=True)
         
         # Find matching skills
-        job_skills = self._extract_skills_from_text(job_text)
-        resume_skills = [s.lower() for s in resume_data.get('skills', [])]
-        matching_skills = list(set(job_skills) & set(resume_skills))
+        job_skills = self._extract_skills_from_text(job_text_lower, already_lower=True)
+        resume_skills = resume_context["skill_set"]
+        # job_skills is unique and in JOB_SKILLS order, so one pass against the
+        # resume set splits it into matching and missing with a stable order
+        matching_skills = [skill for skill in job_skills if skill in resume_skills]
+        missing_skills = [skill for skill in job_skills if skill not in resume_skills]
         
         # Boost score for good skill matches
         if matching_skills:
             skill_bonus = min(25, len(matching_skills) * 8)  # Up to 25 point bonus
-            score = min(100, score + skill_bonus)
+            score += skill_bonus
         
-        # Ensure minimum viable score for demonstration
-        score = max(60, score)  # Minimum 60% (was 45-50)
+        score = self._display_score(score)
         
         # More debug logging
-        logger.info(f"Calculated score: {score}")
-        logger.info(f"Job skills found: {job_skills}")
-        logger.info(f"Matching skills: {matching_skills}")
+        if debug:
+            logger.debug("Calculated score: %s", score)
+            logger.debug("Job skills found: %s", job_skills)
+            logger.debug("Matching skills: %s", matching_skills)
         
         result = {
             "match_score": score,
             "matching_skills": matching_skills[:5],  # Top 5
-            "missing_skills": list(set(job_skills) - set(resume_skills))[:3],
+            "missing_skills": missing_skills[:3],
             "summary": f"Match based on {len(matching_skills)} shared skills and text analysis (Score: {score})" + 
                       (f" | OpenAI unavailable: {self.last_openai_error[:50]}..." if self.openai_quota_exhausted else ""),
             "confidence": "high" if matching_skills else "medium"
         }
         
-        logger.info(f"Final match result: {result}")
+        if debug:
+            logger.debug("Final match result: %s", result)
         return result
     
-    def _calculate_basic_similarity(self, job_text: str, resume_text: str) -> int:
+    @staticmethod
+    def _display_score(raw_score: float) -> int:
+        """Bound a raw similarity score for display: minimum 60% for demonstration (was 45-50), maximum 100"""
+        return max(60, min(100, int(raw_score)))
+    
+    def _calculate_basic_similarity(self, job_text: str, resume_context: Dict[str, Any], already_lower: bool = False) -> int:
         """Enhanced basic text similarity without sklearn"""
-        job_words = set(job_text.lower().split())
-        resume_words = set(resume_text.lower().split())
-        
-        if not job_words or not resume_words:
+        resume_words = resume_context["words"]
+        # Nothing to compare - skip lowercasing and splitting the job text
+        if not resume_words or not job_text or job_text.isspace():
             return 65  # Improved default score (was 50)
         
-        intersection = job_words.intersection(resume_words)
-        union = job_words.union(resume_words)
-        
-        # Enhanced Jaccard similarity with boost
-        base_similarity = len(intersection) / len(union) if union else 0
+        job_words, job_tokens = _word_sets(job_text if already_lower else job_text.lower())
+        if not job_words:
+            return 65  # Improved default score (was 50)
         
-        # Add bonus for skill matches
-        common_skills = [
-            'python', 'javascript', 'react', 'node.js', 'java', 'sql',
-            'aws', 'docker', 'git', 'html', 'css', 'typescript', 'mongodb',
-            'engineer', 'developer', 'software', 'senior', 'junior', 'full-stack'
-        ]
+        # Enhanced Jaccard similarity with boost; |A ∪ B| = |A| + |B| - |A ∩ B|,
+        # so only the intersection needs to be built
+        intersection_size = len(job_words & resume_words)
+        union_size = len(job_words) + len(resume_words) - intersection_size
+        base_similarity = intersection_size / union_size if union_size else 0
         
-        skill_matches = 0
-        for skill in common_skills:
-            if skill in job_text.lower() and skill in resume_text.lower():
-                skill_matches += 1
+        # Add bonus for skill matches (terms present in both texts)
+        skill_matches = len(SIMILARITY_TERMS & job_tokens & resume_context["tokens"])
         
         # Boost score based on skill matches
         skill_boost = min(30, skill_matches * 6)  # Up to 30 point boost (was 20)
@@ -781,14 +1205,6 @@ class JobMatcher:
         final_score = int((base_similarity * 70) + skill_boost)  # Scale base to 70 max (was 80), add skill boost
         return max(60, min(95, final_score))  # Ensure score is between 60-95 (was 45-95)
     
-    def _extract_skills_from_text(self, text: str) -> List[str]:
+    def _extract_skills_from_text(self, text: str, already_lower: bool = False) -> List[str]:
         """Extract potential skills from job text"""
-        common_skills = [
-            'python', 'javascript', 'react', 'node.js', 'java', 'c++', 'sql',
-            'aws', 'docker', 'kubernetes', 'git', 'html', 'css', 'typescript', 
-            'mongodb', 'postgresql', 'redis', 'ai', 'go', 'pytorch'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        return found_skills 
\ No newline at end of file
+        return list(extract_job_skills(text, already_lower))
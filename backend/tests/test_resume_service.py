@@ -0,0 +1,55 @@
+"""
+Tests for the resume text extraction in app.services.resume_service
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.resume_service import ResumeProcessor
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+            xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+            xmlns:v="urn:schemas-microsoft-com:vml">
+  <w:body>
+    <w:p><w:r><w:t>Jane Doe</w:t></w:r></w:p>
+    <w:p>
+      <w:r>
+        <mc:AlternateContent>
+          <mc:Choice Requires="wps">
+            <wps:txbx><w:txbxContent>
+              <w:p><w:r><w:t>Skills: Python, Docker</w:t></w:r></w:p>
+            </w:txbxContent></wps:txbx>
+          </mc:Choice>
+          <mc:Fallback>
+            <v:textbox><w:txbxContent>
+              <w:p><w:r><w:t>Skills: Python, Docker</w:t></w:r></w:p>
+            </w:txbxContent></v:textbox>
+          </mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+    </w:p>
+    <w:p><w:r><w:t>Experience</w:t></w:r><w:r><w:tab/><w:t>2020</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+
+def make_docx(document_xml: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as docx_zip:
+        docx_zip.writestr("word/document.xml", document_xml)
+    return buffer.getvalue()
+
+
+def test_docx_text_box_extracted_once():
+    text = ResumeProcessor()._extract_from_docx(make_docx(DOCUMENT_XML))
+
+    assert text.count("Skills: Python, Docker") == 1
+    assert "Jane Doe" in text
+    assert "Experience\t2020" in text
@@ -5,19 +5,27 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-from functools import wraps
+from functools import wraps, lru_cache
 import uvicorn
 import os
 import logging
 import requests
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import asyncio
 import json
+import hashlib
+import heapq
+import http.cookiejar
 import re
+import threading
 import time
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from rate_limit import api_key_rate_limit, client_ip
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -25,26 +33,34 @@ load_dotenv()
 
 # Simple in-memory rate limiter
 class RateLimiter:
+    GENERAL_LIMIT = 50
+    OPENAI_LIMIT = 10
+    
     def __init__(self):
-        self.requests = defaultdict(list)  # {user_id: [timestamp1, timestamp2, ...]}
-        self.openai_requests = defaultdict(list)  # Separate tracking for API calls
+        # Bounded deques, oldest timestamp on the left: {user_id: deque([timestamp1, timestamp2, ...])}
+        self.requests = defaultdict(lambda: deque(maxlen=self.GENERAL_LIMIT))
+        self.openai_requests = defaultdict(lambda: deque(maxlen=self.OPENAI_LIMIT))  # Separate tracking for API calls
+    
+    @staticmethod
+    def _expire(timestamps: deque, cutoff: datetime) -> None:
+        # Only the expired head is touched, not the whole window
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
     
     def is_allowed(self, user_id: str, max_requests: int = 50, window_hours: int = 24) -> bool:
         now = datetime.now()
         cutoff = now - timedelta(hours=window_hours)
         
         # Clean old requests
-        self.requests[user_id] = [
-            req_time for req_time in self.requests[user_id] 
-            if req_time > cutoff
-        ]
+        user_requests = self.requests[user_id]
+        self._expire(user_requests, cutoff)
         
         # Check if under limit
-        if len(self.requests[user_id]) >= max_requests:
+        if len(user_requests) >= max_requests:
             return False
         
         # Record this request
-        self.requests[user_id].append(now)
+        user_requests.append(now)
         return True
     
     def is_openai_allowed(self, user_id: str, max_openai_calls: int = 10, window_hours: int = 24) -> bool:
@@ -52,17 +68,15 @@ class RateLimiter:
         cutoff = now - timedelta(hours=window_hours)
         
         # Clean old API requests
-        self.openai_requests[user_id] = [
-            req_time for req_time in self.openai_requests[user_id] 
-            if req_time > cutoff
-        ]
+        user_requests = self.openai_requests[user_id]
+        self._expire(user_requests, cutoff)
         
         # Check if under API limit
-        if len(self.openai_requests[user_id]) >= max_openai_calls:
+        if len(user_requests) >= max_openai_calls:
             return False
         
         # Record this API request
-        self.openai_requests[user_id].append(now)
+        user_requests.append(now)
         return True
     
     def get_usage_stats(self, user_id: str) -> Dict[str, Any]:
@@ -82,8 +96,8 @@ class RateLimiter:
             "requests_last_hour": requests_1h,
             "openai_calls_last_24h": openai_24h,
             "openai_calls_last_hour": openai_1h,
-            "openai_limit_24h": 10,
-            "general_limit_24h": 50
+            "openai_limit_24h": self.OPENAI_LIMIT,
+            "general_limit_24h": self.GENERAL_LIMIT
         }
     
     def record_openai_call(self, user_id: str) -> None:
@@ -94,6 +108,33 @@ class RateLimiter:
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+# Shared HTTP session for job page fetches - keeps connections alive across
+# requests instead of paying a fresh TCP/TLS handshake per job page
+http_session = requests.Session()
+# Only the connection pool is shared: refuse all cookies, so one user's fetch never sends
+# cookies set during another's and pool threads never mutate a common jar
+http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+http_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20))
+http_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# Upper bound on HTML read from a single page (default 5 MB)
+MAX_HTML_BYTES = int(os.getenv("MAX_HTML_BYTES", str(5 * 1024 * 1024)))
+
+def fetch_html(url: str, **kwargs) -> bytes:
+    """GET a page through the shared session, streaming the body and stopping at MAX_HTML_BYTES"""
+    with http_session.get(url, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_HTML_BYTES:
+                logger.warning(f"Page {url} exceeds {MAX_HTML_BYTES} bytes, parsing truncated content")
+                break
+        return b''.join(chunks)[:MAX_HTML_BYTES]
+
 # Security Configuration
 EXTENSION_SECURITY_CONFIG = {
     "allowed_extension_ids": [
@@ -178,30 +219,18 @@ def security_dependency(request: Request):
     
     return request
 
-# Import our resume processing services
-try:
-    # Try multiple import paths for different deployment environments
-    try:
-        # First try: direct import (for production)
-        from backend.app.services.resume_service import ResumeProcessor, JobMatcher
-    except ImportError:
-        # Second try: add backend to path (for local development)
-        import sys
-        import os
-        backend_path = os.path.join(os.path.dirname(__file__), 'backend')
-        if backend_path not in sys.path:
-            sys.path.append(backend_path)
-        from app.services.resume_service import ResumeProcessor, JobMatcher
-except ImportError as e:
-    # Fallback if all imports fail
-    logger.warning(f"Failed to import resume services: {e}")
-    ResumeProcessor = None
-    JobMatcher = None
-
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Serialize responses with orjson when available (much faster than json.dumps)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    DefaultResponseClass = ORJSONResponse
+except ImportError:
+    DefaultResponseClass = JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title="JobMatch API",
@@ -209,6 +238,7 @@ app = FastAPI(
     version="1.0.1",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DefaultResponseClass,
 )
 
 # Security middleware to check protected endpoints BEFORE parameter validation
@@ -257,7 +287,7 @@ app.add_middleware(
     ],
     allow_credentials=False,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "X-JobMatch-API-Key", "X-Extension-ID"],
+    allow_headers=["Content-Type", "X-JobMatch-API-Key", "X-Extension-ID", "X-User-API-Key"],
     expose_headers=["*"],
 )
 
@@ -300,31 +330,53 @@ class ScanPageResponse(BaseModel):
     processing_time_ms: int
     processing_method: str = "mock"
 
-# Global services (initialized with environment variables)
-resume_processor = None
-job_matcher = None
+# Import our resume processing services on first use - they pull in openai,
+# pdfplumber and PyPDF2, which would otherwise slow down every worker boot
+@lru_cache(maxsize=1)
+def load_resume_services():
+    """Return (ResumeProcessor, JobMatcher), or (None, None) if they can't be imported"""
+    try:
+        # Try multiple import paths for different deployment environments
+        try:
+            # First try: direct import (for production)
+            from backend.app.services.resume_service import ResumeProcessor, JobMatcher
+        except ImportError:
+            # Second try: add backend to path (for local development)
+            import sys
+            backend_path = os.path.join(os.path.dirname(__file__), 'backend')
+            if backend_path not in sys.path:
+                sys.path.append(backend_path)
+            from app.services.resume_service import ResumeProcessor, JobMatcher
+        return ResumeProcessor, JobMatcher
+    except ImportError as e:
+        # Fallback if all imports fail
+        logger.warning(f"Failed to import resume services: {e}")
+        return None, None
 
+# Global services (initialized with environment variables on first use)
+@lru_cache(maxsize=1)
 def get_resume_processor():
     """Get or create resume processor instance"""
-    global resume_processor
-    if resume_processor is None:
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if ResumeProcessor:
-            resume_processor = ResumeProcessor(openai_api_key=openai_api_key)
-        else:
-            logger.warning("ResumeProcessor not available - using mock processing")
-    return resume_processor
+    ResumeProcessor, _ = load_resume_services()
+    if ResumeProcessor:
+        return ResumeProcessor(openai_api_key=os.getenv("OPENAI_API_KEY"))
+    logger.warning("ResumeProcessor not available - using mock processing")
+    return None
 
+@lru_cache(maxsize=1)
 def get_job_matcher():
     """Get or create job matcher instance"""
-    global job_matcher
-    if job_matcher is None:
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if JobMatcher:
-            job_matcher = JobMatcher(openai_api_key=openai_api_key)
-        else:
-            logger.warning("JobMatcher not available - using mock matching")
-    return job_matcher
+    _, JobMatcher = load_resume_services()
+    if JobMatcher:
+        return JobMatcher(openai_api_key=os.getenv("OPENAI_API_KEY"))
+    logger.warning("JobMatcher not available - using mock matching")
+    return None
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str):
+    """Get a shared OpenAI client so its connection pool is reused across requests"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
 
 @app.get("/")
 async def root():
@@ -419,15 +471,14 @@ async def get_user_usage(user_id: str, request: Request):
     Check rate limiting status for a user
     """
     try:
-        client_ip = request.client.host
-        user_identifier = f"{user_id}_{client_ip}"
+        user_identifier = f"{user_id}_{client_ip(request)}"
         
         usage_stats = rate_limiter.get_usage_stats(user_identifier)
         
         return {
             "success": True,
             "user_id": user_id,
-            "ip": client_ip,
+            "ip": client_ip(request),
             "usage": usage_stats,
             "limits": {
                 "general_requests_per_24h": 50,
@@ -514,7 +565,8 @@ async def upload_resume(
 @app.post("/api/v1/scan/page", response_model=ScanPageResponse)
 async def scan_page_with_resume(
     request: ScanPageRequest, 
-    http_request: Request
+    http_request: Request,
+    user_api_key: str = Depends(api_key_rate_limit)
 ):
     
     """
@@ -525,8 +577,7 @@ async def scan_page_with_resume(
         start_time = time.time()
         
         # Check rate limits
-        client_ip = http_request.client.host
-        user_identifier = f"{request.user_id}_{client_ip}"
+        user_identifier = f"{request.user_id}_{client_ip(http_request)}"
         
         # Check general rate limit
         if not rate_limiter.is_allowed(user_identifier, max_requests=50, window_hours=24):
@@ -552,7 +603,14 @@ async def scan_page_with_resume(
         logger.info(f"Batch processing: {request.batch_processing}")
         
         # Extract jobs from page content
-        jobs = extract_jobs_from_page_content(request.page_content, request.url)
+        # Scraping blocks on HTTP, so run it in a worker thread
+        jobs = await asyncio.to_thread(extract_jobs_from_page_content, request.page_content, request.url)
+        # One precompiled regex pass - cheaper inline than a thread hop
+        resume_text_skills = (
+            extract_skills_from_text(request.resume_text)
+            if request.resume_text and not request.resume_data
+            else []
+        )
         logger.info(f"Extracted {len(jobs)} jobs from page content")
         
         # print("\n" + "="*80)
@@ -653,7 +711,7 @@ async def scan_page_with_resume(
             # Create basic resume data structure from text
             basic_resume_data = {
                 "summary": request.resume_text[:200],
-                "skills": extract_skills_from_text(request.resume_text),
+                "skills": resume_text_skills,
                 "experience": [],
                 "education": []
             }
@@ -683,7 +741,7 @@ async def scan_page_with_resume(
             jobs_found=len(jobs),
             matches=[
                 JobMatch(
-                    id=str(job.get('id', i)),
+                    id=job_content_id(job),
                     title=job.get('title', 'Unknown Title'),
                     company=job.get('company', 'Unknown Company'),
                     location=job.get('location', 'Unknown Location'),
@@ -706,6 +764,107 @@ async def scan_page_with_resume(
         logger.error(f"Scan page failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Page scanning failed: {str(e)}")
 
+# lxml's C parser is several times faster than the pure-Python html.parser
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+def compile_selector_group(selectors: List[str]) -> Dict[str, Any]:
+    """Compile a priority-ordered list of CSS selectors once, plus their union"""
+    return {
+        "union": sv.compile(', '.join(selectors)),
+        "selectors": [(selector, sv.compile(selector)) for selector in selectors]
+    }
+
+def iter_selector_matches(soup: BeautifulSoup, selector_group: Dict[str, Any]):
+    """
+    Yield (selector, elements) in priority order for selectors that match anything.
+    The document is walked once with the union selector; each selector then only
+    filters those candidates instead of walking the whole tree again.
+    """
+    candidates = selector_group["union"].select(soup)
+    for selector, compiled in selector_group["selectors"]:
+        elements = [element for element in candidates if compiled.match(element)]
+        if elements:
+            yield selector, elements
+
+# Job link selectors for Selenium-loaded page content, in priority order
+DYNAMIC_JOB_SELECTORS = compile_selector_group([
+    # Traditional job URL patterns
+    'a[href*="job"]', 'a[href*="position"]', 'a[href*="career"]',
+    'a[href*="opening"]', 'a[href*="role"]', 'a[href*="opportunity"]',
+
+    # Modern job board ID patterns (Ashby, Greenhouse, etc.)
+    'a[href*="jid="]', 'a[href*="ashby_jid="]', 'a[href*="gh_jid="]',
+    'a[href*="lever_id="]', 'a[href*="job_id="]', 'a[href*="posting_id="]',
+
+    # CSS class patterns for job items
+    'a[class*="job"]', 'a[class*="position"]', 'a[class*="career"]',
+    'a[class*="posting"]', 'a[class*="opening"]', 'a[class*="role"]',
+
+    # Ashby specific patterns (common class patterns)
+    'a[class*="undecorated"]', 'a[class*="jobPosting"]', '.ashby-job-posting-brief a',
+    'div[class*="jobPosting"] a', 'div[class*="job-posting"] a',
+])
+
+# Maximum job pages fetched in parallel during a scan (across different hosts)
+JOB_FETCH_CONCURRENCY = int(os.getenv("JOB_FETCH_CONCURRENCY", "4"))
+
+# Be respectful to servers: one job page fetch in flight per host, with a delay after each
+JOB_FETCH_DELAY_SECONDS = 0.5
+host_fetch_locks = defaultdict(threading.Lock)  # {host: lock}
+host_fetch_locks_guard = threading.Lock()
+
+# Headless Chrome launches are heavy - cap them across all scans and fetch workers,
+# independently of JOB_FETCH_CONCURRENCY (default one browser at a time)
+SELENIUM_CONCURRENCY = int(os.getenv("SELENIUM_CONCURRENCY", "1"))
+selenium_slots = threading.Semaphore(SELENIUM_CONCURRENCY)
+
+def host_fetch_lock(job_url: str) -> threading.Lock:
+    """Lock serializing job page fetches to the host of job_url"""
+    host = urlparse(job_url).netloc.lower()
+    with host_fetch_locks_guard:
+        return host_fetch_locks[host]
+
+# Generic job link selectors, in priority order
+GENERIC_JOB_SELECTORS = compile_selector_group([
+    # Traditional job URL patterns
+    'a[href*="job"]', 'a[href*="position"]', 'a[href*="career"]',
+    'a[href*="opening"]', 'a[href*="role"]', 'a[href*="opportunity"]',
+
+    # Modern job board ID patterns (Ashby, Greenhouse, etc.)
+    'a[href*="jid="]', 'a[href*="ashby_jid="]', 'a[href*="gh_jid="]',
+    'a[href*="lever_id="]', 'a[href*="job_id="]', 'a[href*="posting_id="]',
+
+    # Job board specific URL patterns
+    'a[href*="greenhouse.io"]', 'a[href*="lever.co"]', 'a[href*="workday"]',
+    'a[href*="bamboohr"]', 'a[href*="smartrecruiters"]', 'a[href*="jobvite"]',
+
+    # CSS class patterns for job items
+    '.job-link', '.position-link', '.career-link', '.opening-link',
+    '.job-item a', '.position-item a', '.career-item a', '.opening-item a',
+
+    # Modern job board CSS class patterns
+    'a[class*="job"]', 'a[class*="position"]', 'a[class*="career"]',
+    'a[class*="posting"]', 'a[class*="opening"]', 'a[class*="role"]',
+
+    # Ashby specific patterns (common class patterns)
+    'a[class*="undecorated"]', 'a[class*="jobPosting"]', '.ashby-job-posting-brief a',
+    'div[class*="jobPosting"] a', 'div[class*="job-posting"] a',
+
+    # Data attribute patterns
+    '[data-test*="job"] a', '[data-test*="position"] a', '[data-testid*="job"] a',
+    '[data-job-id] a', '[data-posting-id] a', '[data-role-id] a',
+
+    # Title-based selectors
+    '.jobTitle a', '.job-title a', '.position-title a', '.role-title a',
+
+    # Generic container patterns that might contain job links
+    'article a', '.listing a', '.post a', '[role="listitem"] a'
+])
+
 def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> List[Dict[str, Any]]:
     """Extract job listings from page content and fetch full descriptions from individual job pages"""
     
@@ -722,6 +881,7 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
     
     # Check for content script data
     jobs_found = []
+    seen_jobs = set()  # jobs already added - pages often link the same posting twice
     
     # Try new format first - prioritize jobElements with structure
     job_elements = page_content.get('jobElements')
@@ -741,6 +901,10 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
                 
                 # Only add jobs with meaningful titles and URLs
                 if job["title"] and job["title"] not in ['Unknown Position', '', 'Amazon Position'] and job["url"]:
+                    job_key = (job["title"].strip().lower(), job["url"])
+                    if job_key in seen_jobs:
+                        continue
+                    seen_jobs.add(job_key)
                     jobs_found.append(job)
                     logger.info(f"Added job: {job['title']} at {job['company']}")
                 elif element.get('text') and len(element.get('text', '')) > 50:
@@ -750,6 +914,10 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
                     potential_title = lines[0].strip() if lines else 'Position Available'
                     
                     job["title"] = potential_title[:100]  # Limit title length
+                    job_key = (job["title"].strip().lower(), job["url"])
+                    if job_key in seen_jobs:
+                        continue
+                    seen_jobs.add(job_key)
                     jobs_found.append(job)
                     logger.info(f"Added job from text: {job['title']}")
             else:
@@ -802,7 +970,7 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
             
             try:
                 from bs4 import BeautifulSoup
-                soup = BeautifulSoup(page_text, 'html.parser')
+                soup = BeautifulSoup(page_text, HTML_PARSER)
                 
                 # Check what links we can find
                 all_links = soup.find_all('a', href=True)
@@ -817,28 +985,8 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
                 # Use our generic selectors on the Selenium-loaded content
                 logger.info(" Applying job selectors to dynamic content...")
                 
-                # Generic job link selectors - same as in extract_generic_jobs_fallback
-                job_selectors = [
-                    # Traditional job URL patterns
-                    'a[href*="job"]', 'a[href*="position"]', 'a[href*="career"]',
-                    'a[href*="opening"]', 'a[href*="role"]', 'a[href*="opportunity"]',
-                    
-                    # Modern job board ID patterns (Ashby, Greenhouse, etc.)
-                    'a[href*="jid="]', 'a[href*="ashby_jid="]', 'a[href*="gh_jid="]',
-                    'a[href*="lever_id="]', 'a[href*="job_id="]', 'a[href*="posting_id="]',
-                    
-                    # CSS class patterns for job items
-                    'a[class*="job"]', 'a[class*="position"]', 'a[class*="career"]',
-                    'a[class*="posting"]', 'a[class*="opening"]', 'a[class*="role"]',
-                    
-                    # Ashby specific patterns (common class patterns)
-                    'a[class*="undecorated"]', 'a[class*="jobPosting"]', '.ashby-job-posting-brief a',
-                    'div[class*="jobPosting"] a', 'div[class*="job-posting"] a',
-                ]
-                
                 dynamic_jobs = []
-                for selector in job_selectors:
-                    job_links = soup.select(selector)
+                for selector, job_links in iter_selector_matches(soup, DYNAMIC_JOB_SELECTORS):
                     if job_links:
                         logger.info(f" Found {len(job_links)} job links in dynamic content using selector: {selector}")
                         
@@ -872,6 +1020,11 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
                             else:
                                 job_url = url.rstrip('/') + '/' + href
                             
+                            # Same posting linked twice (title + "Apply" link)
+                            if job_url in seen_jobs:
+                                continue
+                            seen_jobs.add(job_url)
+                            
                             dynamic_job = {
                                 "id": f"dynamic-{len(dynamic_jobs)+1}",
                                 "title": title[:100],
@@ -962,7 +1115,8 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
             }
             
             # Extract using Selenium
-            selenium_result = fetch_job_selenium_implementation(url, search_page_job)
+            with selenium_slots:
+                selenium_result = fetch_job_selenium_implementation(url, search_page_job)
             
             if selenium_result and selenium_result.get('description') and len(selenium_result.get('description', '')) > 500:
                 logger.info(f" Selenium extraction successful for Amazon search: {len(selenium_result.get('description', ''))} characters")
@@ -1004,60 +1158,13 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
     if jobs_found:
         logger.info(f"📡 Fetching full job descriptions from {len(jobs_found)} individual job pages...")
         
-        processed_jobs = []
-        for i, job in enumerate(jobs_found):
-            job_url = job.get('url', '')
-            
-            # Skip if no valid URL or same as base URL
-            if not job_url or job_url == url:
-                logger.warning(f"Job {i+1}: No valid URL, using summary description")
-                processed_jobs.append(job)
-                continue
-            
-            try:
-                logger.info(f"🔗 Fetching job {i+1}/{len(jobs_found)}: {job_url}")
-                
-                # Try multiple fetching strategies
-                full_job_data = fetch_job_with_fallback_strategies(job_url, job)
-                
-                if full_job_data and full_job_data.get('description') and len(full_job_data.get('description', '')) > 100:
-                    # Successfully extracted meaningful content
-                    processed_job = {
-                        **job,
-                        "description": full_job_data.get('description', job.get('description', '')),
-                        "requirements": full_job_data.get('requirements', []),
-                        "qualifications": full_job_data.get('qualifications', []),
-                        "benefits": full_job_data.get('benefits', []),
-                        "salary": full_job_data.get('salary', ''),
-                        "job_type": full_job_data.get('job_type', ''),
-                        "posted_date": full_job_data.get('posted_date', ''),
-                        "full_details_fetched": True,
-                        "original_summary": job.get('description', ''),
-                        "extraction_method": full_job_data.get('extraction_method', 'standard_fetch'),
-                        "fetch_success": True
-                    }
-                    
-                    processed_jobs.append(processed_job)
-                    logger.info(f" Job {i+1}: Successfully fetched {len(full_job_data.get('description', ''))} characters using {full_job_data.get('extraction_method', 'unknown')} method")
-                else:
-                    # Extraction failed, keep original data
-                    logger.warning(f" Job {i+1}: Extraction returned minimal content, keeping original summary")
-                    job['full_details_fetched'] = False
-                    job['fetch_success'] = False
-                    job['extraction_method'] = 'failed_extraction'
-                    processed_jobs.append(job)
-                
-                # Add delay to be respectful to servers
-                import time
-                time.sleep(0.5)  # 500ms delay between requests
-                
-            except Exception as e:
-                logger.error(f" Failed to fetch job {i+1} ({job_url}): {str(e)}")
-                # Keep original job data if fetch fails
-                job['full_details_fetched'] = False
-                job['fetch_error'] = str(e)
-                job['fetch_success'] = False
-                processed_jobs.append(job)
+        # Fetch job pages concurrently; fetch_full_job_details holds a per-host lock,
+        # so each site still sees one request at a time. map() keeps the job order
+        with ThreadPoolExecutor(max_workers=JOB_FETCH_CONCURRENCY) as executor:
+            processed_jobs = list(executor.map(
+                lambda item: fetch_full_job_details(item[0], item[1], len(jobs_found), url),
+                enumerate(jobs_found)
+            ))
         
         logger.info(f" standard {len(processed_jobs)} jobs with full descriptions")
         return processed_jobs
@@ -1065,6 +1172,60 @@ def extract_jobs_from_page_content(page_content: Dict[str, Any], url: str) -> Li
     # Fallback if no jobs found at all
     return jobs_found
 
+def fetch_full_job_details(i: int, job: Dict[str, Any], total_jobs: int, url: str) -> Dict[str, Any]:
+    """Fetch the full description for one listed job, keeping the summary on failure"""
+    job_url = job.get('url', '')
+
+    # Skip if no valid URL or same as base URL
+    if not job_url or job_url == url:
+        logger.warning(f"Job {i+1}: No valid URL, using summary description")
+        return job
+
+    try:
+        logger.info(f"🔗 Fetching job {i+1}/{total_jobs}: {job_url}")
+
+        # Try multiple fetching strategies, one job at a time per host
+        with host_fetch_lock(job_url):
+            try:
+                full_job_data = fetch_job_with_fallback_strategies(job_url, job)
+            finally:
+                time.sleep(JOB_FETCH_DELAY_SECONDS)  # delay between requests to the same host
+
+        if full_job_data and full_job_data.get('description') and len(full_job_data.get('description', '')) > 100:
+            # Successfully extracted meaningful content
+            processed_job = {
+                **job,
+                "description": full_job_data.get('description', job.get('description', '')),
+                "requirements": full_job_data.get('requirements', []),
+                "qualifications": full_job_data.get('qualifications', []),
+                "benefits": full_job_data.get('benefits', []),
+                "salary": full_job_data.get('salary', ''),
+                "job_type": full_job_data.get('job_type', ''),
+                "posted_date": full_job_data.get('posted_date', ''),
+                "full_details_fetched": True,
+                "original_summary": job.get('description', ''),
+                "extraction_method": full_job_data.get('extraction_method', 'standard_fetch'),
+                "fetch_success": True
+            }
+
+            logger.info(f" Job {i+1}: Successfully fetched {len(full_job_data.get('description', ''))} characters using {full_job_data.get('extraction_method', 'unknown')} method")
+            return processed_job
+        else:
+            # Extraction failed, keep original data
+            logger.warning(f" Job {i+1}: Extraction returned minimal content, keeping original summary")
+            job['full_details_fetched'] = False
+            job['fetch_success'] = False
+            job['extraction_method'] = 'failed_extraction'
+            return job
+
+    except Exception as e:
+        logger.error(f" Failed to fetch job {i+1} ({job_url}): {str(e)}")
+        # Keep original job data if fetch fails
+        job['full_details_fetched'] = False
+        job['fetch_error'] = str(e)
+        job['fetch_success'] = False
+        return job
+
 def fetch_job_with_fallback_strategies(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
     """
     Try multiple strategies to fetch job content from different types of sites
@@ -1132,12 +1293,8 @@ def fetch_job_with_fallback_strategies(job_url: str, basic_job: Dict[str, Any])
 def fetch_job_static(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
     """Static HTML fetching with better session handling and headers"""
     
-    import requests
     from bs4 import BeautifulSoup
     
-    # Create session with headers
-    session = requests.Session()
-    
     # Mimic a real browser more closely
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -1157,14 +1314,11 @@ def fetch_job_static(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
         'sec-ch-ua-platform': '"macOS"'
     }
     
-    session.headers.update(headers)
-    
-    # Make request with session
-    response = session.get(job_url, timeout=15, allow_redirects=True)
-    response.raise_for_status()
+    # Make request with the shared session
+    html = fetch_html(job_url, headers=headers, timeout=15, allow_redirects=True)
     
     # Parse response
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER)
     
     # Initialize job data structure
     job_data = {
@@ -1215,25 +1369,26 @@ def fetch_job_static(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
             logger.warning(f" Short description detected ({len(job_data.get('description', ''))} chars), retrying with Selenium")
             # Use Selenium for Deutsche Bank jobs
             from selenium_job_extractor import SeleniumJobExtractor
-            extractor = SeleniumJobExtractor(headless=True)
-            try:
-                # Ensure we have a valid job URL
-                if '#/professional/job/' in job_url:
-                    job_id = job_url.split('/job/')[-1]
-                    base_url = 'https://careers.db.com/professionals/search-roles/'
-                    job_url = f"{base_url}#/professional/job/{job_id}"
-                    logger.info(f"🔗 Using full Deutsche Bank URL: {job_url}")
-                
-                job_data = extractor.extract_deutsche_bank_job_selenium(job_url, basic_job)
+            with selenium_slots:
+                extractor = SeleniumJobExtractor(headless=True)
+                try:
+                    # Ensure we have a valid job URL
+                    if '#/professional/job/' in job_url:
+                        job_id = job_url.split('/job/')[-1]
+                        base_url = 'https://careers.db.com/professionals/search-roles/'
+                        job_url = f"{base_url}#/professional/job/{job_id}"
+                        logger.info(f"🔗 Using full Deutsche Bank URL: {job_url}")
                 
-                # Verify we got a substantial description
-                if len(job_data.get('description', '')) < 100:
-                    logger.warning(" Selenium extraction still got short description, retrying with longer wait")
-                    # Retry with longer wait
-                    extractor.driver.set_page_load_timeout(30)
                     job_data = extractor.extract_deutsche_bank_job_selenium(job_url, basic_job)
-            finally:
-                extractor.close()
+                
+                    # Verify we got a substantial description
+                    if len(job_data.get('description', '')) < 100:
+                        logger.warning(" Selenium extraction still got short description, retrying with longer wait")
+                        # Retry with longer wait
+                        extractor.driver.set_page_load_timeout(30)
+                        job_data = extractor.extract_deutsche_bank_job_selenium(job_url, basic_job)
+                finally:
+                    extractor.close()
     else:
         logger.info(" Using generic extraction for unknown site")
         job_data = extract_generic_job(soup, job_data)
@@ -1246,7 +1401,6 @@ def fetch_job_static(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
 def fetch_job_api_discovery(job_url: str, basic_job: Dict[str, Any]) -> Dict[str, Any]:
     """Try to discover and use internal APIs for job content"""
     
-    import requests
     import json
     import re
     
@@ -1273,7 +1427,7 @@ def fetch_job_api_discovery(job_url: str, basic_job: Dict[str, Any]) -> Dict[str
                 
                 for api_url in api_endpoints:
                     try:
-                        response = requests.get(api_url, headers=headers, timeout=10)
+                        response = http_session.get(api_url, headers=headers, timeout=10)
                         if response.status_code == 200 and 'application/json' in response.headers.get('content-type', ''):
                             data = response.json()
                             
@@ -1300,7 +1454,8 @@ def fetch_job_selenium_fallback(job_url: str, basic_job: Dict[str, Any]) -> Dict
         from selenium_job_extractor import fetch_job_selenium_implementation
         
         logger.info(" Using Selenium WebDriver for JavaScript content")
-        result = fetch_job_selenium_implementation(job_url, basic_job)
+        with selenium_slots:
+            result = fetch_job_selenium_implementation(job_url, basic_job)
         
         if result and result.get('description') and len(result.get('description', '')) > 100:
             logger.info(f" Selenium extraction successful: {len(result.get('description', ''))} characters")
@@ -1451,16 +1606,36 @@ def extract_company_from_url(url: str) -> str:
     else:
         return "Tech Corp"
 
+COMMON_SKILLS = (
+    'Python', 'JavaScript', 'React', 'Node.js', 'Java', 'SQL',
+    'AWS', 'Docker', 'Git', 'HTML', 'CSS', 'TypeScript', 'MongoDB'
+)
+
+def compile_skill_pattern(skills) -> re.Pattern:
+    """
+    One case-insensitive alternation over whole skill names, longest first, so a
+    single findall replaces a substring scan per skill and 'java' no longer
+    matches inside 'javascript'. Lookarounds instead of \\b keep 'c++'/'node.js' matchable.
+    """
+    return re.compile(
+        r'(?<!\w)(?:' + '|'.join(re.escape(skill) for skill in sorted(skills, key=len, reverse=True)) + r')(?!\w)',
+        re.IGNORECASE
+    )
+
+COMMON_SKILLS_PATTERN = compile_skill_pattern(COMMON_SKILLS)
+
+@lru_cache(maxsize=1024)
+def whole_skill_pattern(skill_lower: str) -> re.Pattern:
+    """
+    Word-bounded regex for one lowercase skill. Resume skills can overlap ('react' and
+    'react native'), which a single alternation would match only once, so each gets its own
+    """
+    return re.compile(r'(?<!\w)' + re.escape(skill_lower) + r'(?!\w)')
+
 def extract_skills_from_text(text: str) -> List[str]:
     """Extract skills from resume text"""
-    common_skills = [
-        'Python', 'JavaScript', 'React', 'Node.js', 'Java', 'SQL',
-        'AWS', 'Docker', 'Git', 'HTML', 'CSS', 'TypeScript', 'MongoDB'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = [skill for skill in common_skills if skill.lower() in text_lower]
-    return found_skills
+    found = {match.lower() for match in COMMON_SKILLS_PATTERN.findall(text)}
+    return [skill for skill in COMMON_SKILLS if skill.lower() in found]
 
 def get_mock_job_matches(url: str) -> List[Dict[str, Any]]:
     """Fallback mock job matches"""
@@ -1531,15 +1706,14 @@ async def fetch_job_details(
             'Cache-Control': 'max-age=0'
         }
         
-        # Use session for better connection handling
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        response = session.get(job_url, timeout=15, allow_redirects=True)
-        response.raise_for_status()
+        # Use the shared session for better connection handling; the fetch and
+        # parse block, so run them in a worker thread to keep the event loop free
+        html = await asyncio.to_thread(
+            fetch_html, job_url, headers=headers, timeout=15, allow_redirects=True
+        )
         
         # Parse HTML content
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = await asyncio.to_thread(BeautifulSoup, html, HTML_PARSER)
         
         # Initialize job data structure
         job = {
@@ -2246,6 +2420,14 @@ def extract_bamboohr_job(soup: BeautifulSoup, job: Dict[str, Any]) -> Dict[str,
     
     return job
 
+# Location phrases looked for in page text, compiled once
+LOCATION_TEXT_PATTERNS = [
+    re.compile(r'Location[:\s]+([^.\n]+)'),
+    re.compile(r'Based in ([^.\n]+)'),
+    re.compile(r'([A-Z][a-z]+,\s*[A-Z]{2,})'),  # City, State format
+    re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+)'),  # City, Country format
+]
+
 def extract_amazon_job(soup: BeautifulSoup, job: Dict[str, Any]) -> Dict[str, Any]:
     """Extract job details from Amazon Jobs using universal extraction (standard)"""
     
@@ -2313,19 +2495,12 @@ def extract_amazon_job(soup: BeautifulSoup, job: Dict[str, Any]) -> Dict[str, An
         # Extract location from description
         if not job.get("location") or job.get("location") == "Location":
             full_text = soup.get_text()
-            # Look for location patterns in the text
-            import re
-            location_patterns = [
-                r'Location[:\s]+([^.\n]+)',
-                r'Based in ([^.\n]+)',
-                r'([A-Z][a-z]+,\s*[A-Z]{2,})',  # City, State format
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',  # City, Country format
-            ]
-            
-            for pattern in location_patterns:
-                matches = re.findall(pattern, full_text)
-                if matches:
-                    location = matches[0].strip()
+            # Look for location patterns in the text; only the first hit is
+            # used, so search() stops there instead of findall() scanning the page
+            for pattern in LOCATION_TEXT_PATTERNS:
+                match = pattern.search(full_text)
+                if match:
+                    location = match.group(1).strip()
                     if len(location) > 2 and len(location) < 50:
                         job["location"] = location
                         logger.info(f" Extracted location from text: {location}")
@@ -2397,13 +2572,23 @@ def extract_generic_job(soup: BeautifulSoup, job: Dict[str, Any]) -> Dict[str, A
     
     return job
 
+def job_content_id(job: Dict[str, Any]) -> str:
+    """Stable job ID from title, company and URL (same job -> same ID across scans and workers)"""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(job.get('title', '')).encode())
+    h.update(b'|')
+    h.update(str(job.get('company', '')).encode())
+    h.update(b'|')
+    h.update(str(job.get('url', '')).encode())
+    return h.hexdigest()
+
+
 def clean_job_data(job: Dict[str, Any]) -> Dict[str, Any]:
     """Clean and normalize job data"""
     
     # Clean up title
     if job.get("title"):
-        job["title"] = " ".join(job["title"].split())  # Remove extra whitespace
-        job["title"] = job["title"].replace('\n', ' ').replace('\t', ' ')
+        job["title"] = " ".join(job["title"].split())  # Collapses whitespace, newlines and tabs in one pass
     
     # Clean up company
     if job.get("company"):
@@ -2412,8 +2597,7 @@ def clean_job_data(job: Dict[str, Any]) -> Dict[str, Any]:
     
     # Clean up location
     if job.get("location"):
-        job["location"] = job["location"].replace('\n', ', ').replace('\t', ' ')
-        job["location"] = " ".join(job["location"].split())
+        job["location"] = " ".join(job["location"].replace('\n', ', ').split())
     
     # Clean up description
     if job.get("description"):
@@ -2528,9 +2712,8 @@ async def batch_job_matching(
             if job.get('match_score', 0) >= threshold_score
         ]
         
-        # Sort by match score and limit results
-        filtered_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-        top_jobs = filtered_jobs[:request.max_results]
+        # Take the top results by match score (partial selection, no full sort)
+        top_jobs = heapq.nlargest(request.max_results, filtered_jobs, key=lambda x: x.get('match_score', 0))
         
         # Add ranking
         for i, job in enumerate(top_jobs):
@@ -2569,7 +2752,7 @@ async def batch_job_matching(
             jobs_found=len(request.jobs),
             matches=[
                 JobMatch(
-                    id=str(job.get('id', i)),
+                    id=job_content_id(job),
                     title=job.get('title', 'Unknown Title'),
                     company=job.get('company', 'Unknown Company'),
                     location=job.get('location', 'Unknown Location'),
@@ -2697,10 +2880,7 @@ async def batch_analyze_jobs_with_openai(jobs: List[Dict], resume_data: Dict, ap
     Now prioritizes OpenAI's match scores over inflated similarity matching
     """
     try:
-        import openai
-        from openai import OpenAI
-        
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         
         # logger.info(" Creating concise job summaries for OpenAI analysis...")
         job_summaries = []
@@ -2840,6 +3020,9 @@ Focus on realistic assessment. Don't inflate scores - be honest about gaps.
         # Fallback to similarity matching
         return await batch_analyze_jobs_similarity(jobs, resume_data)
 
+# General tech terms worth a small bonus in similarity matching
+SIMILARITY_TECH_TERMS = ('api', 'database', 'cloud', 'agile')
+
 async def batch_analyze_jobs_similarity(jobs: List[Dict], resume_data: Dict) -> List[Dict]:
     """
      FIXED: More realistic similarity-based matching when OpenAI is not available
@@ -2848,12 +3031,13 @@ async def batch_analyze_jobs_similarity(jobs: List[Dict], resume_data: Dict) ->
     try:
         logger.info(f" Using similarity matching as fallback for {len(jobs)} jobs")
         
-        # Common words to exclude from matching
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'a', 'an', 'as', 'are', 'was', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'is', 'am', 'we', 'you', 'they', 'them', 'their', 'this', 'that', 'these', 'those', 'if', 'when', 'where', 'how', 'why', 'what', 'who', 'which'}
-        
-        # Prepare resume text
+        # Lowercase resume skills once instead of once per job
         resume_skills = resume_data.get('skills', [])
-        resume_text = ' '.join(str(skill) for skill in resume_skills) + ' ' + str(resume_data.get('summary', ''))
+        resume_skills_lower = [(skill, str(skill).lower()) for skill in resume_skills]
+        # Whole-word matches only ('java' doesn't count inside 'javascript')
+        resume_skill_patterns = [
+            (skill, whole_skill_pattern(skill_lower)) for skill, skill_lower in resume_skills_lower if skill_lower.strip()
+        ]
         
         # Analyze each job with REALISTIC scoring
         analyzed_jobs = []
@@ -2866,8 +3050,8 @@ async def batch_analyze_jobs_similarity(jobs: List[Dict], resume_data: Dict) ->
                 skill_match_count = 0
                 
                 # Count actual skill matches (be strict)
-                for skill in resume_skills:
-                    if str(skill).lower() in job_text_lower:
+                for skill, skill_pattern in resume_skill_patterns:
+                    if skill_pattern.search(job_text_lower):
                         skill_matches.append(skill)
                         skill_match_count += 1
                 
@@ -2885,8 +3069,7 @@ async def batch_analyze_jobs_similarity(jobs: List[Dict], resume_data: Dict) ->
                 
                 # Much smaller bonuses
                 tech_bonus = 0
-                tech_terms = ['api', 'database', 'cloud', 'agile']  # Reduced list
-                tech_matches = [term for term in tech_terms if term in job_text_lower]
+                tech_matches = [term for term in SIMILARITY_TECH_TERMS if term in job_text_lower]
                 if tech_matches:
                     tech_bonus = min(len(tech_matches) * 2, 8)  # Max 8 points from tech terms
                 
@@ -3365,8 +3548,6 @@ async def batch_analyze_jobs_advanced(jobs: List[Dict], resume_data: Dict, api_k
     Two-stage process: Llama for extraction, OpenAI for matching
     """
     try:
-        import openai
-        from openai import OpenAI
         import time
         
         # start_time = time.time()
@@ -3396,7 +3577,7 @@ async def batch_analyze_jobs_advanced(jobs: List[Dict], resume_data: Dict, api_k
                     logger.info(f" RESUME DEBUG: First experience keys: {list(first_exp.keys())}")
                     logger.info(f" RESUME DEBUG: Has technologies field: {'technologies' in first_exp}")
         
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         
         logger.info(f" OPENAI standard DEBUG: OpenAI client created successfully")
         
@@ -3740,7 +3921,6 @@ def extract_ashby_jobs_fallback(url: str) -> List[Dict[str, Any]]:
     """
     
     try:
-        import requests
         from bs4 import BeautifulSoup
         
         logger.info(f" Ashby fallback extraction for: {url}")
@@ -3756,9 +3936,8 @@ def extract_ashby_jobs_fallback(url: str) -> List[Dict[str, Any]]:
             'Upgrade-Insecure-Requests': '1'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_html(url, headers=headers, timeout=15)
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         scraped_jobs = []
         
@@ -3956,16 +4135,14 @@ def extract_greenhouse_jobs_fallback(url: str) -> List[Dict[str, Any]]:
     """Fallback extraction for Greenhouse job boards"""
     
     try:
-        import requests
         from bs4 import BeautifulSoup
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_html(url, headers=headers, timeout=10)
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         scraped_jobs = []
         
@@ -4009,16 +4186,14 @@ def extract_lever_jobs_fallback(url: str) -> List[Dict[str, Any]]:
     """Fallback extraction for Lever job boards"""
     
     try:
-        import requests
         from bs4 import BeautifulSoup
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_html(url, headers=headers, timeout=10)
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         scraped_jobs = []
         
@@ -4064,16 +4239,14 @@ def extract_workday_jobs_fallback(url: str) -> List[Dict[str, Any]]:
     """Fallback extraction for Workday job boards"""
     
     try:
-        import requests
         from bs4 import BeautifulSoup
         
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_html(url, headers=headers, timeout=10)
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         scraped_jobs = []
         
@@ -4117,7 +4290,6 @@ def extract_generic_jobs_fallback(url: str) -> List[Dict[str, Any]]:
     """Generic fallback extraction for unknown job sites"""
     
     try:
-        import requests
         from bs4 import BeautifulSoup
         
         logger.info(f" Attempting generic job scraping from: {url}")
@@ -4126,51 +4298,12 @@ def extract_generic_jobs_fallback(url: str) -> List[Dict[str, Any]]:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_html(url, headers=headers, timeout=10)
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         scraped_jobs = []
         
-        # Generic job link selectors
-        job_selectors = [
-            # Traditional job URL patterns
-            'a[href*="job"]', 'a[href*="position"]', 'a[href*="career"]',
-            'a[href*="opening"]', 'a[href*="role"]', 'a[href*="opportunity"]',
-            
-            # Modern job board ID patterns (Ashby, Greenhouse, etc.)
-            'a[href*="jid="]', 'a[href*="ashby_jid="]', 'a[href*="gh_jid="]',
-            'a[href*="lever_id="]', 'a[href*="job_id="]', 'a[href*="posting_id="]',
-            
-            # Job board specific URL patterns
-            'a[href*="greenhouse.io"]', 'a[href*="lever.co"]', 'a[href*="workday"]',
-            'a[href*="bamboohr"]', 'a[href*="smartrecruiters"]', 'a[href*="jobvite"]',
-            
-            # CSS class patterns for job items
-            '.job-link', '.position-link', '.career-link', '.opening-link',
-            '.job-item a', '.position-item a', '.career-item a', '.opening-item a',
-            
-            # Modern job board CSS class patterns
-            'a[class*="job"]', 'a[class*="position"]', 'a[class*="career"]',
-            'a[class*="posting"]', 'a[class*="opening"]', 'a[class*="role"]',
-            
-            # Ashby specific patterns (common class patterns)
-            'a[class*="undecorated"]', 'a[class*="jobPosting"]', '.ashby-job-posting-brief a',
-            'div[class*="jobPosting"] a', 'div[class*="job-posting"] a',
-            
-            # Data attribute patterns
-            '[data-test*="job"] a', '[data-test*="position"] a', '[data-testid*="job"] a',
-            '[data-job-id] a', '[data-posting-id] a', '[data-role-id] a',
-            
-            # Title-based selectors
-            '.jobTitle a', '.job-title a', '.position-title a', '.role-title a',
-            
-            # Generic container patterns that might contain job links
-            'article a', '.listing a', '.post a', '[role="listitem"] a'
-        ]
-        
-        for selector in job_selectors:
-            job_links = soup.select(selector)
+        for selector, job_links in iter_selector_matches(soup, GENERIC_JOB_SELECTORS):
             if job_links:
                 logger.info(f" Found {len(job_links)} job links using selector: {selector}")
                 
@@ -4423,7 +4556,7 @@ def extract_generic_job(soup: BeautifulSoup, job: Dict[str, Any]) -> Dict[str, A
 if __name__ == "__main__":
     print("Starting standard Bulk-Scanner API server...")
     print(f"OpenAI API Key available: {bool(os.getenv('OPENAI_API_KEY'))}")
-    print(f"Resume processing available: {ResumeProcessor is not None}")
+    print(f"Resume processing available: {load_resume_services()[0] is not None}")
     
     # Show extraction methods status
     print("\n Job Extraction Methods:")
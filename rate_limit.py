@@ -0,0 +1,175 @@
+"""
+Rate limiting for the JobMatch API.
+Token bucket per key, shared through Redis when REDIS_URL is set,
+otherwise kept in this process's memory.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+# Optional Redis backend so the limit holds across uvicorn workers / instances
+try:
+    import redis
+    redis_client = redis.Redis.from_url(os.environ["REDIS_URL"]) if os.getenv("REDIS_URL") else None
+except ImportError:
+    redis = None
+    redis_client = None
+
+# Atomically refill, consume and expire a bucket in one round trip
+TOKEN_BUCKET_LUA = """
+local max_tokens = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])  -- tokens per millisecond
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or max_tokens
+local last_refill = tonumber(bucket[2]) or now
+tokens = math.min(max_tokens, tokens + math.max(0, now - last_refill) * refill_rate)
+local allowed = 0
+local retry_ms = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_ms = math.ceil((cost - tokens) / refill_rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_refill', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((max_tokens - tokens) / refill_rate) + 1000)
+return {allowed, retry_ms}
+"""
+token_bucket_script = redis_client.register_script(TOKEN_BUCKET_LUA) if redis_client else None  # EVALSHA after first load
+
+# In-memory token buckets (used without Redis), least recently used first
+bucket_state = OrderedDict()  # {bucket_key: (tokens, last_refill)}
+MAX_LOCAL_BUCKETS = 10000  # hard cap - the least recently used bucket is evicted past this
+denied_until = OrderedDict()  # {bucket_key: timestamp} - skips Redis while a bucket is known to be empty
+API_KEY_RATE_LIMIT = int(os.getenv("API_KEY_RATE_LIMIT", "100"))  # 100 requests per hour per API key
+API_KEY_HEADER = "X-User-API-Key"
+# Proxies in front of the app that append to X-Forwarded-For. 0 (the Docker deploys, which
+# publish uvicorn directly) ignores the client-controlled header; Procfile/render set 1
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+def parse_rate(spec: str):
+    """Parse a limit like "10/hour" into (capacity, refill tokens per second)"""
+    count, period = spec.split("/")
+    capacity = float(count)
+    return capacity, capacity / PERIOD_SECONDS[period.strip().lower()]
+
+def bounded_set(state: OrderedDict, key: str, value) -> None:
+    """Store key as most recently used, evicting the oldest entry once MAX_LOCAL_BUCKETS is reached"""
+    if key in state:
+        state.move_to_end(key)
+    elif len(state) >= MAX_LOCAL_BUCKETS:
+        state.popitem(last=False)
+    state[key] = value
+
+def take_local_token(bucket_key: str, capacity: float, refill_rate: float, now: float) -> bool:
+    """Token bucket check against this process's own counters"""
+    tokens, last_refill = bucket_state.get(bucket_key, (capacity, now))
+
+    # Refill whole tokens only and carry the leftover time forward,
+    # so repeated calls don't accumulate rounding error
+    refilled = int((now - last_refill) * refill_rate)
+    if refilled:
+        tokens += refilled
+        last_refill += refilled / refill_rate
+    if tokens >= capacity:
+        tokens, last_refill = capacity, now
+
+    # Check if under limit
+    if tokens < 1:
+        bounded_set(bucket_state, bucket_key, (tokens, last_refill))
+        return False
+
+    # Consume a token for this request
+    bounded_set(bucket_state, bucket_key, (tokens - 1, last_refill))
+    return True
+
+def take_token(bucket_key: str, capacity: float, refill_rate: float) -> bool:
+    """Consume one token from a bucket, shared through Redis when configured"""
+    now = time.time()
+    if token_bucket_script is None:
+        return take_local_token(bucket_key, capacity, refill_rate, now)
+
+    # Denied recently - no need to ask Redis again until a token is due
+    if denied_until.get(bucket_key, 0) > now:
+        return False
+
+    try:
+        allowed, retry_ms = token_bucket_script(
+            keys=[f"bucket:{bucket_key}"],
+            args=[capacity, refill_rate / 1000, int(now * 1000), 1]
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Redis rate limit check failed, using in-memory limiter: {e}")
+        return take_local_token(bucket_key, capacity, refill_rate, now)
+
+    if not allowed:
+        bounded_set(denied_until, bucket_key, now + int(retry_ms) / 1000)
+        return False
+
+    denied_until.pop(bucket_key, None)
+    return True
+
+def client_ip(request: Request) -> str:
+    """
+    Address of the calling client. Behind TRUSTED_PROXY_HOPS proxies that is the entry
+    those proxies appended to X-Forwarded-For; anything left of it is client-supplied.
+    """
+    if TRUSTED_PROXY_HOPS > 0:
+        forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if forwarded:
+            return forwarded[-min(TRUSTED_PROXY_HOPS, len(forwarded))]
+    return request.client.host if request.client else "unknown"
+
+def api_key_id(api_key: str) -> str:
+    """Bucket key for an API key - hashed so raw keys never appear in Redis key names or memory dumps"""
+    return "key:" + hashlib.sha256(api_key.encode()).hexdigest()
+
+async def api_key_from_request(request: Request) -> str:
+    # The extension's shared X-JobMatch-API-Key identifies the app, not the user, so requests
+    # without a personal key get a bucket per client IP. The body's user_id is client-chosen
+    # and only used by the per-user daily RateLimiter, never to pick this bucket
+    api_key = request.headers.get(API_KEY_HEADER)
+    if api_key:
+        return api_key_id(api_key)
+    return f"ip:{client_ip(request)}"
+
+def make_limiter(spec: str, key_func=api_key_from_request, scope: str = "api_key", scope_label: str = "API key"):
+    """
+    Build a FastAPI dependency enforcing `spec` (e.g. "10/hour").
+    The spec is parsed once here; each request only does the bucket update.
+    """
+    capacity, refill_rate = parse_rate(spec)
+    prefix = f"{scope}:{spec}:"
+    count, period = spec.split("/")
+    detail = f"Rate limit exceeded. Maximum {count} requests per {period} per {scope_label}."
+
+    async def rate_limit_dependency(request: Request):
+        key = await key_func(request)
+        if not take_token(prefix + key, capacity, refill_rate):
+            raise HTTPException(status_code=429, detail=detail)
+        return key
+
+    return rate_limit_dependency
+
+API_KEY_SPEC = f"{API_KEY_RATE_LIMIT}/hour"
+API_KEY_LIMIT = parse_rate(API_KEY_SPEC)
+API_KEY_PREFIX = f"api_key:{API_KEY_SPEC}:"
+
+def check_api_key_rate_limit(api_key: str) -> bool:
+    """Check if API key has exceeded rate limit"""
+    capacity, refill_rate = API_KEY_LIMIT
+    return take_token(API_KEY_PREFIX + api_key_id(api_key), capacity, refill_rate)
+
+# FastAPI dependency enforcing the per-API-key hourly limit
+api_key_rate_limit = make_limiter(API_KEY_SPEC)